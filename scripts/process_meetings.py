@@ -4,39 +4,132 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
 import csv
 import datetime as dt
+import functools
+import hashlib
 import json
+import multiprocessing
 import os
+import random
 import re
 import sqlite3
 import subprocess
 import sys
 import tempfile
-from html import unescape
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from html import escape
+from html.parser import HTMLParser
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 try:
-    from dotenv import load_dotenv  # type: ignore
+    import orjson  # type: ignore
+
+    json_loads = orjson.loads
 except Exception:  # pragma: no cover - optional dependency
-    load_dotenv = None
+    json_loads = json.loads
 
 CALIBRE_ROOT_DEFAULT = Path(
     os.getenv("CALIBRE_ROOT", "/Users/kbrooks/Dropbox/Books/Calibre Travel Library")
 )
 MEETING_TAG_PREFIXES_DEFAULT = ("Meetings",)
+LLM_MAX_ATTEMPTS = 3
+DEVELOPMENT_LOG_MAX_TITLES = 10
 DATE_FMT = "%Y-%m-%d"
 REPO_ROOT = Path(__file__).resolve().parent.parent
 PROMPTS_DIR = REPO_ROOT / "prompts"
 LLM_SYSTEM_PROMPT_PATH = PROMPTS_DIR / "llm_extraction_system.txt"
 LLM_USER_PROMPT_PATH = PROMPTS_DIR / "llm_extraction_user.txt"
+LLM_BATCH_USER_PROMPT_PATH = PROMPTS_DIR / "llm_extraction_batch_user.txt"
 LLM_RISKS_PROMPT_PATH = PROMPTS_DIR / "risks.txt"
 LLM_ISSUES_PROMPT_PATH = PROMPTS_DIR / "issues.txt"
 LLM_TASKS_PROMPT_PATH = PROMPTS_DIR / "tasks.txt"
 LLM_DEVELOPMENT_PROMPT_PATH = PROMPTS_DIR / "development.txt"
 PANDOC_PDF_ENGINE = os.getenv("PANDOC_PDF_ENGINE", "xelatex")
+# Calibre databases are only ever read, so favour a large page cache and mmap over durability.
+SQLITE_READ_PRAGMAS = (
+    "PRAGMA query_only=1",
+    "PRAGMA cache_size=-40000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+)
+# Structured-output schema for LLM extraction; the model must return {"items": [...]}.
+LLM_ITEMS_SCHEMA: Dict[str, Any] = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "type": {"type": "string", "enum": ["grow", "glow"]},
+            "summary": {"type": "string"},
+            "owner": {"type": "string"},
+            "behavior": {
+                "type": "string",
+                "enum": ["Student", "Teacher", "Community", "Company", ""],
+            },
+        },
+        "required": ["type", "summary", "owner", "behavior"],
+        "additionalProperties": False,
+    },
+}
+LLM_RESPONSE_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "development_items",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"items": LLM_ITEMS_SCHEMA},
+            "required": ["items"],
+            "additionalProperties": False,
+        },
+    },
+}
+LLM_BATCH_RESPONSE_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "development_items_by_meeting",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "meetings": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "items": LLM_ITEMS_SCHEMA,
+                        },
+                        "required": ["id", "items"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["meetings"],
+            "additionalProperties": False,
+        },
+    },
+}
+_SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9]+")
+LATEX_REPLACEMENTS = {
+    "\\": r"\textbackslash{}",
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}",
+}
+_LATEX_SPECIALS_RE = re.compile("|".join(re.escape(char) for char in LATEX_REPLACEMENTS))
 
 
 @dataclass
@@ -122,12 +215,48 @@ def parse_args() -> argparse.Namespace:
         default=20000,
         help="Max characters from the transcript to send to the LLM (to control token costs). Use 0 for no limit.",
     )
+    parser.add_argument(
+        "--llm-min-chars",
+        type=int,
+        default=200,
+        help="Skip the LLM call for transcripts shorter than this many characters.",
+    )
     parser.add_argument(
         "--llm-max-output-tokens",
         type=int,
         default=1600,
         help="Max completion tokens for the LLM response.",
     )
+    parser.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=8,
+        help="Max number of LLM requests in flight at once.",
+    )
+    parser.add_argument(
+        "--llm-batch-size",
+        type=int,
+        default=1,
+        help="Pack up to this many meetings into one LLM request, bounded by --llm-max-chars (1 disables batching).",
+    )
+    parser.add_argument(
+        "--llm-max-rpm",
+        type=int,
+        default=0,
+        help="Cap LLM requests per minute (0 for no cap).",
+    )
+    parser.add_argument(
+        "--llm-max-tpm",
+        type=int,
+        default=0,
+        help="Cap estimated LLM tokens (prompt + max output) per minute (0 for no cap).",
+    )
+    parser.add_argument(
+        "--no-llm-cache",
+        dest="llm_cache",
+        action="store_false",
+        help="Always re-extract PDFs and call the LLM instead of reusing log-dir/llm_cache.sqlite.",
+    )
     parser.add_argument(
         "--llm-debug",
         action="store_true",
@@ -156,12 +285,28 @@ def as_date(value: str) -> dt.date:
     return dt.datetime.strptime(value, DATE_FMT).date()
 
 
-def normalize_text(value: str) -> str:
-    return re.sub(r"\s+", " ", value).strip().lower()
+# Sized to hold every distinct Person/Owner/Description cell of a large log, since the merge,
+# sort and person-page helpers normalize the same cells repeatedly within a run.
+@functools.lru_cache(maxsize=65536)
+def _normalize_text_cached(value: str) -> str:
+    # str.split() collapses the same whitespace set as \s+ without going through the regex engine.
+    return " ".join(value.split()).lower()
+
+
+def normalize_text(value: Any) -> str:
+    # Only strings reach the cache; anything else (e.g. a list `type` in a malformed LLM
+    # payload) normalizes to "" rather than failing as an unhashable cache key.
+    if not isinstance(value, str):
+        return ""
+    return _normalize_text_cached(value)
 
 
+@functools.lru_cache(maxsize=1)
 def load_system_prompt() -> str:
-    """Load the LLM system prompt plus category prompts so they can be edited without code changes."""
+    """Load the LLM system prompt plus category prompts so they can be edited without code changes.
+
+    Prompt files are read once per run; the result is cached for every subsequent meeting.
+    """
     try:
         base = LLM_SYSTEM_PROMPT_PATH.read_text(encoding="utf-8").strip()
         development = LLM_DEVELOPMENT_PROMPT_PATH.read_text(encoding="utf-8").strip()
@@ -176,12 +321,17 @@ def load_system_prompt() -> str:
     return "\n".join(sections)
 
 
-def build_user_prompt(meeting: Meeting, transcript: str) -> str:
-    """Load and format the user prompt for the LLM call."""
+@functools.lru_cache(maxsize=1)
+def load_user_prompt_template() -> str:
     try:
-        template = LLM_USER_PROMPT_PATH.read_text(encoding="utf-8")
+        return LLM_USER_PROMPT_PATH.read_text(encoding="utf-8")
     except FileNotFoundError as exc:
         raise RuntimeError(f"Missing LLM user prompt file: {LLM_USER_PROMPT_PATH}") from exc
+
+
+def build_user_prompt(meeting: Meeting, transcript: str) -> str:
+    """Format the (cached) user prompt template for the LLM call."""
+    template = load_user_prompt_template()
     try:
         return template.format(
             meeting_title=meeting.title,
@@ -192,41 +342,81 @@ def build_user_prompt(meeting: Meeting, transcript: str) -> str:
         raise RuntimeError(f"LLM user prompt template is missing placeholder: {exc}") from exc
 
 
+@functools.lru_cache(maxsize=1)
+def load_batch_user_prompt_template() -> str:
+    try:
+        return LLM_BATCH_USER_PROMPT_PATH.read_text(encoding="utf-8")
+    except FileNotFoundError as exc:
+        raise RuntimeError(f"Missing LLM batch prompt file: {LLM_BATCH_USER_PROMPT_PATH}") from exc
+
+
+def build_batch_user_prompt(batch: Sequence[Tuple[Meeting, str]]) -> str:
+    """Format one user prompt holding several meetings, each tagged with its book id."""
+    sections = [
+        f"=== MEETING id={meeting.book_id}: {meeting.title} ({meeting.meeting_date}) ===\n{transcript}"
+        for meeting, transcript in batch
+    ]
+    template = load_batch_user_prompt_template()
+    try:
+        return template.format(meetings="\n\n".join(sections))
+    except KeyError as exc:
+        raise RuntimeError(f"LLM batch prompt template is missing placeholder: {exc}") from exc
+
+
+def connect_readonly(db_path: Path) -> sqlite3.Connection:
+    """Open a Calibre database read-only with read-tuned PRAGMAs applied."""
+    conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    for pragma in SQLITE_READ_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
 def load_meetings(
-    metadata_db: Path,
+    conn: sqlite3.Connection,
     calibre_root: Path,
     start: dt.date,
     end: dt.date,
     tag_prefixes: Sequence[str],
     author_filter: Optional[str],
 ) -> List[Meeting]:
-    conn = sqlite3.connect(metadata_db)
     cur = conn.cursor()
     like_clauses = " OR ".join("t.name LIKE ?" for _ in tag_prefixes)
     params: List[str] = [f"{p}%" for p in tag_prefixes]
     author_clause = ""
     if author_filter:
-        author_clause = "AND a.name = ?"
+        # A correlated EXISTS avoids fanning rows out per author (and the DISTINCT to undo it).
+        author_clause = """AND EXISTS (
+            SELECT 1 FROM books_authors_link bal JOIN authors a ON a.id = bal.author
+            WHERE bal.book = b.id AND a.name = ?
+        )"""
         params.append(author_filter)
-    rows = cur.execute(
+    # Tags look like "<prefix>.YYYY-MM-DD"; zero-padded ISO dates compare correctly as
+    # strings, so SQL prefilters the date window before any tag is parsed in Python.
+    # Shorter, unpadded dates like "2024-1-06" do not, so they always pass through and
+    # the strptime range check below decides.
+    params.extend([start.strftime(DATE_FMT), end.strftime(DATE_FMT)])
+    cur.execute(
         f"""
-        SELECT DISTINCT b.id, b.title, b.path, t.name
+        SELECT b.id, b.title, b.path, t.name
         FROM books b
         JOIN books_tags_link btl ON b.id = btl.book
         JOIN tags t ON t.id = btl.tag
-        LEFT JOIN books_authors_link bal ON b.id = bal.book
-        LEFT JOIN authors a ON bal.author = a.id
         WHERE ({like_clauses}) {author_clause}
+          AND (
+            substr(t.name, instr(t.name, '.') + 1) BETWEEN ? AND ?
+            OR length(substr(t.name, instr(t.name, '.') + 1)) < 10
+          )
         """,
         params,
-    ).fetchall()
+    )
     meetings: List[Meeting] = []
-    for book_id, title, rel_path, tag in rows:
+    for book_id, title, rel_path, tag in cur:
         tag_date = tag.split(".", 1)[-1]
         try:
             meeting_date = as_date(tag_date)
         except ValueError:
             continue
+        # Unpadded dates bypass the SQL window, so the range is enforced here.
         if meeting_date < start or meeting_date > end:
             continue
         meeting_path = calibre_root / rel_path
@@ -239,50 +429,73 @@ def load_meetings(
                 tag=tag,
             )
         )
-    conn.close()
     return meetings
 
 
-def fetch_pdf_path(metadata_db: Path, calibre_root: Path, meeting: Meeting) -> Optional[Path]:
-    conn = sqlite3.connect(metadata_db)
+def fetch_pdf_paths(
+    conn: sqlite3.Connection, meetings: Sequence[Meeting]
+) -> Dict[int, Path]:
+    """Resolve PDF paths for all meetings with a single query, keyed by book id."""
+    if not meetings:
+        return {}
+    by_id = {meeting.book_id: meeting for meeting in meetings}
+    placeholders = ",".join("?" for _ in by_id)
     cur = conn.cursor()
-    row = cur.execute(
-        "SELECT name, format FROM data WHERE book = ? AND format = 'PDF' LIMIT 1",
-        (meeting.book_id,),
-    ).fetchone()
-    conn.close()
-    if not row:
-        return None
-    name, fmt = row
-    filename = f"{name}.{fmt.lower()}"
-    pdf_path = meeting.path / filename
-    return pdf_path if pdf_path.exists() else None
+    rows = cur.execute(
+        f"SELECT book, name, format FROM data WHERE format = 'PDF' AND book IN ({placeholders})",
+        list(by_id),
+    ).fetchall()
+    pdf_paths: Dict[int, Path] = {}
+    for book_id, name, fmt in rows:
+        if book_id in pdf_paths:
+            continue
+        pdf_path = by_id[book_id].path / f"{name}.{fmt.lower()}"
+        if pdf_path.exists():
+            pdf_paths[book_id] = pdf_path
+    return pdf_paths
 
 
-def load_searchable_text(fts_db: Path, book_id: int) -> Optional[str]:
-    conn = sqlite3.connect(fts_db)
+def load_searchable_texts(conn: sqlite3.Connection, book_ids: Sequence[int]) -> Dict[int, str]:
+    """Load the newest non-empty searchable text for each book with a single query."""
+    if not book_ids:
+        return {}
+    placeholders = ",".join("?" for _ in book_ids)
     cur = conn.cursor()
-    row = cur.execute(
-        """
-        SELECT searchable_text
+    rows = cur.execute(
+        f"""
+        SELECT book, searchable_text
         FROM books_text
-        WHERE book = ? AND searchable_text IS NOT NULL AND searchable_text != ''
+        WHERE book IN ({placeholders}) AND searchable_text IS NOT NULL AND searchable_text != ''
         ORDER BY timestamp DESC
-        LIMIT 1
         """,
-        (book_id,),
-    ).fetchone()
-    conn.close()
-    if row:
-        return row[0]
-    return None
+        list(book_ids),
+    ).fetchall()
+    texts: Dict[int, str] = {}
+    for book_id, text in rows:
+        texts.setdefault(book_id, text)
+    return texts
 
 
 def extract_from_pdf(pdf_path: Path) -> Optional[str]:
+    """Extract PDF text with PyMuPDF when installed (much faster), falling back to pypdf."""
+    try:
+        import pymupdf  # type: ignore
+    except Exception:  # pragma: no cover - optional dependency
+        pymupdf = None
     try:
-        from pypdf import PdfReader  # type: ignore
+        if pymupdf is not None:
+            with pymupdf.open(str(pdf_path)) as doc:
+                chunks = [text for page in doc if (text := page.get_text("text"))]
+        else:
+            try:
+                from pypdf import PdfReader  # type: ignore
+            except Exception:
+                return None
+            reader = PdfReader(str(pdf_path))
+            chunks = [text for page in reader.pages if (text := page.extract_text())]
     except Exception:
         return None
+    return "\n".join(chunks) or None
 
 
 def write_llm_debug(
@@ -293,9 +506,10 @@ def write_llm_debug(
     *,
     response: Any,
     error_message: Optional[str],
+    cached_content: Optional[str] = None,
 ) -> None:
     debug_dir.mkdir(parents=True, exist_ok=True)
-    slug = re.sub(r"[^A-Za-z0-9]+", "_", meeting.title).strip("_").lower() or "meeting"
+    slug = _SAFE_NAME_RE.sub("_", meeting.title).strip("_").lower() or "meeting"
     date_label = meeting.meeting_date.strftime(DATE_FMT)
     filename = f"{date_label}_{meeting.book_id}_{slug}.json"
     path = debug_dir / filename
@@ -308,6 +522,8 @@ def write_llm_debug(
         finish_reason = getattr(choice, "finish_reason", None)
         message = getattr(choice, "message", None)
         content = getattr(message, "content", None) if message else None
+    if cached_content is not None:
+        content = cached_content
     usage = getattr(response, "usage", None) if response else None
     if usage is not None:
         try:
@@ -330,52 +546,142 @@ def write_llm_debug(
             "finish_reason": finish_reason,
             "content": content,
             "usage": usage,
+            "cached": cached_content is not None,
         },
         "error": error_message,
     }
     path.write_text(json.dumps(payload, indent=2, ensure_ascii=True), encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=1)
+def load_env() -> None:
+    """Load the repo's .env once per interpreter; only the OpenAI settings come from it."""
     try:
-        reader = PdfReader(str(pdf_path))
-        chunks = []
-        for page in reader.pages:
-            text = page.extract_text() or ""
-            if text:
-                chunks.append(text)
-        return "\n".join(chunks) if chunks else None
-    except Exception:
-        return None
+        from dotenv import load_dotenv  # type: ignore
+    except Exception:  # pragma: no cover - optional dependency
+        return
+    load_dotenv(Path(__file__).resolve().parent.parent / ".env")
 
 
-def llm_extract_items_openai(
-    text: str,
-    meeting: Meeting,
-    model: str,
-    max_chars: int,
-    max_output_tokens: int,
-    debug_dir: Optional[Path],
-    debug_title: Optional[str],
-    *,
-    verbose: bool = False,
-) -> List[Item]:
-    """Call OpenAI to extract items. Requires OPENAI_API_KEY."""
+def create_openai_client() -> Any:
+    """Create the AsyncOpenAI client shared by every meeting in a run. Requires OPENAI_API_KEY."""
+    load_env()
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY not set; cannot use LLM extraction.")
     try:
-        from openai import OpenAI  # type: ignore
+        from openai import AsyncOpenAI  # type: ignore
     except Exception as exc:
         raise RuntimeError(
             f"openai import failed using interpreter {sys.executable}: {exc!r}"
         ) from exc
+    # Retries are handled in request_llm_completion so every attempt passes the rate limiter.
+    return AsyncOpenAI(api_key=api_key, max_retries=0)
+
+
+class TokenBucket:
+    """Async token bucket refilling `capacity` units evenly over `period` seconds."""
+
+    def __init__(self, capacity: float, period: float = 60.0) -> None:
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+
+class LLMRateLimiter:
+    """Keep LLM traffic under requests-per-minute and tokens-per-minute caps (0 disables a cap)."""
+
+    def __init__(self, max_rpm: int, max_tpm: int) -> None:
+        self.requests = TokenBucket(max_rpm) if max_rpm > 0 else None
+        self.tokens = TokenBucket(max_tpm) if max_tpm > 0 else None
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        if self.requests is not None:
+            await self.requests.acquire(1)
+        if self.tokens is not None:
+            await self.tokens.acquire(estimated_tokens)
+
+
+def open_llm_cache(path: Path) -> sqlite3.Connection:
+    """Open (creating if needed) the on-disk cache of raw LLM responses and extracted PDF text."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, payload TEXT, created_at INTEGER)"
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS pdf_text (key BLOB PRIMARY KEY, text TEXT, created_at INTEGER)"
+    )
+    return conn
 
+
+def llm_cache_key(model: str, system_prompt: str, user_prompt: str) -> bytes:
+    digest = hashlib.blake2b()
+    for part in (model, system_prompt, user_prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.digest()
+
+
+def llm_cache_get(conn: sqlite3.Connection, key: bytes) -> Optional[str]:
+    row = conn.execute("SELECT payload FROM cache WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def llm_cache_put(conn: sqlite3.Connection, key: bytes, payload: str) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO cache (key, payload, created_at) VALUES (?, ?, ?)",
+        (key, payload, int(dt.datetime.now().timestamp())),
+    )
+    conn.commit()
+
+
+def pdf_text_cache_key(pdf_path: Path) -> bytes:
+    # Path + size + mtime changes whenever Calibre replaces the file, without reading its bytes.
+    stat = pdf_path.stat()
+    digest = hashlib.blake2b()
+    digest.update(f"{pdf_path.resolve()}\x00{stat.st_size}\x00{stat.st_mtime_ns}".encode("utf-8"))
+    return digest.digest()
+
+
+def pdf_text_cache_get(conn: sqlite3.Connection, key: bytes) -> Optional[str]:
+    row = conn.execute("SELECT text FROM pdf_text WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def pdf_text_cache_put(conn: sqlite3.Connection, key: bytes, text: str) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO pdf_text (key, text, created_at) VALUES (?, ?, ?)",
+        (key, text, int(dt.datetime.now().timestamp())),
+    )
+    conn.commit()
+
+
+def select_transcript(
+    text: str, meeting: Meeting, max_chars: int, verbose: bool = False
+) -> Tuple[str, Dict[str, object]]:
+    """Pick the part of a transcript sent to the LLM, plus a note describing the choice."""
     marker = "AI: Behaviors"
     marker_index = text.find(marker)
-    selection_note = {}
     if marker_index != -1:
         window_chars = 10000
         end_index = marker_index + window_chars
         trimmed_text = text[marker_index:end_index]
-        selection_note = {
+        selection_note: Dict[str, object] = {
             "mode": "marker_window",
             "marker": marker,
             "marker_index": marker_index,
@@ -399,82 +705,174 @@ def llm_extract_items_openai(
     else:
         trimmed_text = text
         selection_note = {"mode": "full_text"}
-    system_prompt = load_system_prompt()
-    user_prompt = build_user_prompt(meeting, trimmed_text)
-    should_debug = bool(debug_dir) and (
-        not debug_title or debug_title.lower() in meeting.title.lower()
-    )
-    response = None
-    error_message = None
-    client = OpenAI(api_key=api_key)
+    return trimmed_text, selection_note
+
+
+def wants_llm_debug(meeting: Meeting, debug_dir: Optional[Path], debug_title: Optional[str]) -> bool:
+    return bool(debug_dir) and (not debug_title or debug_title.lower() in meeting.title.lower())
+
+
+async def request_llm_completion(
+    client: Any,
+    request_messages: List[Dict[str, str]],
+    model: str,
+    max_output_tokens: int,
+    response_format: Dict[str, Any],
+    *,
+    label: str,
+    rate_limiter: Optional[LLMRateLimiter] = None,
+    verbose: bool = False,
+) -> Any:
+    """Send one chat completion, retrying rate limits and transient errors with backoff."""
+    from openai import APIConnectionError, InternalServerError, RateLimitError  # type: ignore
+
+    # The system prompt and the static instructions that open each user prompt are
+    # byte-identical across calls; the per-meeting transcript and title follow them, so
+    # OpenAI's automatic prompt caching can reuse the shared prefix on every call.
+    system_prompt = request_messages[0]["content"]
+    prompt_cache_key = "llmscanner-" + hashlib.blake2b(
+        system_prompt.encode("utf-8"), digest_size=8
+    ).hexdigest()
+    # Rough prompt size (~4 chars per token) plus the completion budget, which OpenAI
+    # also counts against the tokens-per-minute limit.
+    prompt_chars = sum(len(message["content"]) for message in request_messages)
+    estimated_tokens = prompt_chars // 4 + max_output_tokens
+    attempt = 1
+    while True:
+        if rate_limiter is not None:
+            await rate_limiter.acquire(estimated_tokens)
+        try:
+            return await client.chat.completions.create(
+                model=model,
+                messages=request_messages,
+                temperature=0.2,
+                max_completion_tokens=max_output_tokens,
+                prompt_cache_key=prompt_cache_key,
+                response_format=response_format,
+            )
+        except (RateLimitError, APIConnectionError, InternalServerError) as exc:
+            if attempt == LLM_MAX_ATTEMPTS:
+                raise
+            delay = 2 ** (attempt - 1) + random.random()
+            if verbose:
+                print(
+                    f"Retrying LLM call for {label} in {delay:.1f}s after "
+                    f"{type(exc).__name__} (attempt {attempt}/{LLM_MAX_ATTEMPTS})."
+                )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+async def fetch_llm_payload(
+    client: Any,
+    system_prompt: str,
+    user_prompt: str,
+    model: str,
+    max_output_tokens: int,
+    response_format: Dict[str, Any],
+    *,
+    label: str,
+    debug_dir: Optional[Path],
+    debug_meetings: Sequence[Meeting],
+    selection_note: Dict[str, object],
+    cache: Optional[sqlite3.Connection] = None,
+    rate_limiter: Optional[LLMRateLimiter] = None,
+    verbose: bool = False,
+) -> Any:
+    """Return the decoded JSON answer for one prompt, from the cache or the API.
+
+    Debug files are written for each meeting in `debug_meetings`, from the cached
+    answer on a cache hit.
+    """
+    cache_key = llm_cache_key(model, system_prompt, user_prompt)
+    cached_content = llm_cache_get(cache, cache_key) if cache is not None else None
     request_messages = [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": user_prompt},
     ]
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=request_messages,
-            temperature=0.2,
-            max_completion_tokens=max_output_tokens,
-        )
-    except Exception as exc:
-        error_message = f"{type(exc).__name__}: {exc}"
-        if should_debug:
+    if cached_content is not None:
+        content = cached_content
+        if verbose:
+            print(f"LLM cache hit for {label}; skipping API call.")
+        for meeting in debug_meetings:
             write_llm_debug(
                 debug_dir,
                 meeting,
                 request_messages,
                 selection_note,
                 response=None,
+                error_message=None,
+                cached_content=cached_content,
+            )
+    else:
+        response = None
+        error_message = None
+        try:
+            response = await request_llm_completion(
+                client,
+                request_messages,
+                model,
+                max_output_tokens,
+                response_format,
+                label=label,
+                rate_limiter=rate_limiter,
+                verbose=verbose,
+            )
+        except Exception as exc:
+            error_message = f"{type(exc).__name__}: {exc}"
+            for meeting in debug_meetings:
+                write_llm_debug(
+                    debug_dir,
+                    meeting,
+                    request_messages,
+                    selection_note,
+                    response=None,
+                    error_message=error_message,
+                )
+            raise
+        for meeting in debug_meetings:
+            write_llm_debug(
+                debug_dir,
+                meeting,
+                request_messages,
+                selection_note,
+                response=response,
                 error_message=error_message,
             )
-        raise
-    if should_debug:
-        write_llm_debug(
-            debug_dir,
-            meeting,
-            request_messages,
-            selection_note,
-            response=response,
-            error_message=error_message,
-        )
-    if not response.choices:
-        raise RuntimeError("LLM returned no choices.")
-    choice = response.choices[0]
-    content = choice.message.content
-    if content is None or not content.strip():
-        finish_reason = getattr(choice, "finish_reason", "unknown")
-        raise RuntimeError(f"LLM returned empty content (finish_reason={finish_reason}).")
-    if verbose:
-        response_id = getattr(response, "id", "unknown")
-        finish_reason = getattr(choice, "finish_reason", "unknown")
-        print(
-            f"LLM response received for {meeting.title}: id={response_id}, "
-            f"finish_reason={finish_reason}, chars={len(content)}."
-        )
+        if not response.choices:
+            raise RuntimeError("LLM returned no choices.")
+        choice = response.choices[0]
+        content = choice.message.content
+        if content is None or not content.strip():
+            finish_reason = getattr(choice, "finish_reason", "unknown")
+            raise RuntimeError(f"LLM returned empty content (finish_reason={finish_reason}).")
+        if verbose:
+            response_id = getattr(response, "id", "unknown")
+            finish_reason = getattr(choice, "finish_reason", "unknown")
+            print(
+                f"LLM response received for {label}: id={response_id}, "
+                f"finish_reason={finish_reason}, chars={len(content)}."
+            )
 
-    def strip_code_fences(raw: str) -> str:
-        fenced = raw.strip()
-        if fenced.startswith("```") and fenced.endswith("```"):
-            fenced = fenced.strip("`")
-            # Drop optional language hint like ```json
-            parts = fenced.split("\n", 1)
-            if len(parts) == 2:
-                return parts[1]
-        return raw
-
-    content = strip_code_fences(content)
+    # Structured outputs guarantee the schema, but a response cut off by the token limit
+    # can still be invalid JSON.
     try:
-        data = json.loads(content)
-    except json.JSONDecodeError as exc:
+        payload = json_loads(content)
+    except ValueError as exc:
         raise RuntimeError(f"LLM returned non-JSON content: {content}") from exc
+    if cache is not None and cached_content is None:
+        llm_cache_put(cache, cache_key, content)
+    return payload
+
 
+def parse_llm_items(data: Any, meeting: Meeting, verbose: bool = False) -> List[Item]:
+    """Validate the raw `items` list the LLM returned for one meeting."""
     items: List[Item] = []
     if not isinstance(data, list):
         if verbose:
             print(
-                f"LLM response for {meeting.title} is {type(data).__name__}, expected a list."
+                f"LLM response for {meeting.title} has no items list "
+                f"(got {type(data).__name__})."
             )
         return items
     raw_count = len(data)
@@ -516,103 +914,219 @@ def llm_extract_items_openai(
     return items
 
 
+async def llm_extract_items_openai(
+    client: Any,
+    text: str,
+    meeting: Meeting,
+    model: str,
+    max_chars: int,
+    max_output_tokens: int,
+    debug_dir: Optional[Path],
+    debug_title: Optional[str],
+    *,
+    cache: Optional[sqlite3.Connection] = None,
+    rate_limiter: Optional[LLMRateLimiter] = None,
+    verbose: bool = False,
+) -> List[Item]:
+    """Call OpenAI to extract items using the shared client from create_openai_client().
+
+    When `cache` is given, raw responses are memoized by model and prompt so unchanged
+    transcripts skip the API call on later runs.
+    """
+    trimmed_text, selection_note = select_transcript(text, meeting, max_chars, verbose)
+    payload = await fetch_llm_payload(
+        client,
+        load_system_prompt(),
+        build_user_prompt(meeting, trimmed_text),
+        model,
+        max_output_tokens,
+        LLM_RESPONSE_FORMAT,
+        label=meeting.title,
+        debug_dir=debug_dir,
+        debug_meetings=[meeting] if wants_llm_debug(meeting, debug_dir, debug_title) else [],
+        selection_note=selection_note,
+        cache=cache,
+        rate_limiter=rate_limiter,
+        verbose=verbose,
+    )
+    data = payload.get("items") if isinstance(payload, dict) else None
+    return parse_llm_items(data, meeting, verbose)
+
+
+async def llm_extract_items_openai_batch(
+    client: Any,
+    batch: Sequence[Tuple[Meeting, str]],
+    model: str,
+    max_output_tokens: int,
+    debug_dir: Optional[Path],
+    debug_title: Optional[str],
+    *,
+    cache: Optional[sqlite3.Connection] = None,
+    rate_limiter: Optional[LLMRateLimiter] = None,
+    verbose: bool = False,
+) -> Dict[int, List[Item]]:
+    """Extract items for several (meeting, trimmed transcript) pairs in one request.
+
+    Returns items keyed by book id; `max_output_tokens` is the per-meeting budget.
+    """
+    by_id = {meeting.book_id: meeting for meeting, _ in batch}
+    label = f"batch of {len(batch)} meeting(s) (ids={','.join(str(book_id) for book_id in by_id)})"
+    payload = await fetch_llm_payload(
+        client,
+        load_system_prompt(),
+        build_batch_user_prompt(batch),
+        model,
+        max_output_tokens * len(batch),
+        LLM_BATCH_RESPONSE_FORMAT,
+        label=label,
+        debug_dir=debug_dir,
+        debug_meetings=[
+            meeting for meeting in by_id.values() if wants_llm_debug(meeting, debug_dir, debug_title)
+        ],
+        selection_note={"mode": "batch", "book_ids": list(by_id)},
+        cache=cache,
+        rate_limiter=rate_limiter,
+        verbose=verbose,
+    )
+    results: Dict[int, List[Item]] = {book_id: [] for book_id in by_id}
+    entries = payload.get("meetings") if isinstance(payload, dict) else None
+    if not isinstance(entries, list):
+        if verbose:
+            print(f"LLM response for {label} has no meetings list (got {type(payload).__name__}).")
+        return results
+    for entry in entries:
+        meeting = by_id.get(entry.get("id")) if isinstance(entry, dict) else None
+        if meeting is None:
+            if verbose:
+                print(f"LLM response for {label} has an entry for an unknown meeting: {entry!r:.80}.")
+            continue
+        results[meeting.book_id].extend(parse_llm_items(entry.get("items"), meeting, verbose))
+    return results
+
+
+def pack_meeting_batches(
+    transcripts: Sequence[Tuple[Meeting, str]], batch_size: int, max_chars: int
+) -> List[List[Tuple[Meeting, str]]]:
+    """First-fit-decreasing packing of transcripts into batches of at most `batch_size`
+    meetings and (when `max_chars` > 0) at most `max_chars` characters."""
+    batches: List[List[Tuple[Meeting, str]]] = []
+    sizes: List[int] = []
+    for entry in sorted(transcripts, key=lambda pair: len(pair[1]), reverse=True):
+        size = len(entry[1])
+        for index, batch in enumerate(batches):
+            if len(batch) < batch_size and (max_chars <= 0 or sizes[index] + size <= max_chars):
+                batch.append(entry)
+                sizes[index] += size
+                break
+        else:
+            batches.append([entry])
+            sizes.append(size)
+    return batches
+
+
+DEVELOPMENT_CSV_HEADERS = ["Person", "Date", "Meeting", "Kind", "Behavior", "Summary"]
+LEGACY_DEVELOPMENT_CSV_HEADERS = ["Person", "Date", "Behavior", "Summary", "Meeting"]
+BEHAVIOR_LABELS = {
+    "student": "Student",
+    "teacher": "Teacher",
+    "community": "Community",
+    "company": "Company",
+}
+
+
+def normalize_kind(value: str) -> str:
+    lowered = value.strip().lower()
+    if lowered == "grow":
+        return "Grow"
+    if lowered == "glow":
+        return "Glow"
+    return value.strip().title()
+
+
+def normalize_behavior(value: Optional[str]) -> str:
+    if not value:
+        return ""
+    cleaned = value.strip()
+    if not cleaned:
+        return ""
+    return BEHAVIOR_LABELS.get(cleaned.lower(), cleaned)
+
+
+def split_legacy_behavior(value: str) -> Tuple[str, str]:
+    raw = value.strip()
+    if not raw:
+        return "", ""
+    if ":" in raw:
+        kind_part, behavior_part = raw.split(":", 1)
+        return normalize_kind(kind_part), normalize_behavior(behavior_part)
+    return normalize_kind(raw), ""
+
+
+def migrate_legacy_development_csv(csv_path: Path) -> None:
+    """Rewrite a legacy per-person CSV in place using DEVELOPMENT_CSV_HEADERS."""
+    legacy_headers = LEGACY_DEVELOPMENT_CSV_HEADERS
+    legacy_rows: List[List[str]] = []
+    with csv_path.open("r", encoding="utf-8", newline="") as handle:
+        reader = csv.reader(handle)
+        next(reader, None)
+        for row in reader:
+            if not row:
+                continue
+            padded = list(row) + [""] * (len(legacy_headers) - len(row))
+            if len(padded) < len(legacy_headers):
+                continue
+            person_val, date_val, legacy_behavior, summary, meeting = padded[:5]
+            kind_val, behavior_val = split_legacy_behavior(legacy_behavior)
+            legacy_rows.append([person_val, date_val, meeting, kind_val, behavior_val, summary])
+    temp_path = csv_path.with_suffix(".csv.tmp")
+    with temp_path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(DEVELOPMENT_CSV_HEADERS)
+        writer.writerows(legacy_rows)
+    temp_path.replace(csv_path)
+
+
 def append_development_csv_by_person(items: Sequence[Item], log_dir: Path) -> int:
+    """Append items to one CSV per person, touching each file once per run."""
     csv_dir = log_dir / "development_by_person"
     csv_dir.mkdir(parents=True, exist_ok=True)
-    expected_headers = ["Person", "Date", "Meeting", "Kind", "Behavior", "Summary"]
-    legacy_headers = ["Person", "Date", "Behavior", "Summary", "Meeting"]
-    appended = 0
+    items_by_path: Dict[Path, List[Item]] = defaultdict(list)
     for item in items:
         person = item.owner or "Unassigned"
-        safe_name = re.sub(r"[^A-Za-z0-9]+", "_", person.strip()).strip("_") or "Unassigned"
-        csv_path = csv_dir / f"{safe_name}.csv"
-
-        def normalize_kind(value: str) -> str:
-            lowered = value.strip().lower()
-            if lowered == "grow":
-                return "Grow"
-            if lowered == "glow":
-                return "Glow"
-            return value.strip().title()
-
-        def normalize_behavior(value: Optional[str]) -> str:
-            if not value:
-                return ""
-            cleaned = value.strip()
-            if not cleaned:
-                return ""
-            mapping = {
-                "student": "Student",
-                "teacher": "Teacher",
-                "community": "Community",
-                "company": "Company",
-            }
-            return mapping.get(cleaned.lower(), cleaned)
-
-        def split_legacy_behavior(value: str) -> Tuple[str, str]:
-            raw = value.strip()
-            if not raw:
-                return "", ""
-            if ":" in raw:
-                kind_part, behavior_part = raw.split(":", 1)
-                return normalize_kind(kind_part), normalize_behavior(behavior_part)
-            return normalize_kind(raw), ""
-
-        existing_headers: Optional[List[str]] = None
+        safe_name = _SAFE_NAME_RE.sub("_", person.strip()).strip("_") or "Unassigned"
+        items_by_path[csv_dir / f"{safe_name}.csv"].append(item)
+
+    appended = 0
+    for csv_path, person_items in items_by_path.items():
+        write_header = True
         if csv_path.exists() and csv_path.stat().st_size > 0:
+            write_header = False
             with csv_path.open("r", encoding="utf-8", newline="") as handle:
-                reader = csv.reader(handle)
-                existing_headers = next(reader, [])
-            if existing_headers == legacy_headers:
-                legacy_rows: List[List[str]] = []
-                with csv_path.open("r", encoding="utf-8", newline="") as handle:
-                    reader = csv.reader(handle)
-                    next(reader, None)
-                    for row in reader:
-                        if not row:
-                            continue
-                        padded = list(row) + [""] * (len(legacy_headers) - len(row))
-                        if len(padded) < len(legacy_headers):
-                            continue
-                        person_val, date_val, legacy_behavior, summary, meeting = padded[:5]
-                        kind_val, behavior_val = split_legacy_behavior(legacy_behavior)
-                        legacy_rows.append(
-                            [person_val, date_val, meeting, kind_val, behavior_val, summary]
-                        )
-                temp_path = csv_path.with_suffix(".csv.tmp")
-                with temp_path.open("w", encoding="utf-8", newline="") as handle:
-                    writer = csv.writer(handle)
-                    writer.writerow(expected_headers)
-                    writer.writerows(legacy_rows)
-                temp_path.replace(csv_path)
-                existing_headers = expected_headers
-            elif existing_headers != expected_headers:
+                existing_headers = next(csv.reader(handle), [])
+            if existing_headers == LEGACY_DEVELOPMENT_CSV_HEADERS:
+                migrate_legacy_development_csv(csv_path)
+            elif existing_headers != DEVELOPMENT_CSV_HEADERS:
                 print(
                     f"Warning: {csv_path} has unexpected headers {existing_headers}; "
                     "appending with the new format."
                 )
 
-        write_header = not csv_path.exists() or csv_path.stat().st_size == 0
-        if existing_headers == expected_headers:
-            write_header = False
-
-        kind_label = normalize_kind(item.kind)
-        behavior_value = normalize_behavior(item.behavior)
         with csv_path.open("a", encoding="utf-8", newline="") as handle:
             writer = csv.writer(handle)
             if write_header:
-                writer.writerow(expected_headers)
-            writer.writerow(
+                writer.writerow(DEVELOPMENT_CSV_HEADERS)
+            writer.writerows(
                 [
-                    person,
+                    item.owner or "Unassigned",
                     item.meeting.meeting_date.strftime(DATE_FMT),
                     item.meeting.title,
-                    kind_label,
-                    behavior_value,
+                    normalize_kind(item.kind),
+                    normalize_behavior(item.behavior),
                     item.summary,
                 ]
+                for item in person_items
             )
-        appended += 1
+        appended += len(person_items)
     return appended
 
 
@@ -623,9 +1137,9 @@ def load_log_table(path: Path) -> Tuple[List[str], List[Dict[str, str]]]:
 
 
 def load_log_table_from_lines(lines: Sequence[str]) -> Tuple[List[str], List[Dict[str, str]]]:
-    text = "\n".join(lines)
-    if "<table" in text:
-        return load_html_table(text)
+    # Only join the lines into one string when they actually hold an HTML table.
+    if any("<table" in line for line in lines):
+        return load_html_table("\n".join(lines))
     headers: List[str] = []
     rows: List[Dict[str, str]] = []
     for line in lines:
@@ -643,18 +1157,80 @@ def load_log_table_from_lines(lines: Sequence[str]) -> Tuple[List[str], List[Dic
     return headers, rows
 
 
+class _HTMLTableParser(HTMLParser):
+    """Collect the text of each <th>/<td> cell, row by row, in a single linear scan.
+
+    Only table tags are structure: any other markup inside a cell (including a stray
+    "<" from free text in logs written before cells were escaped) is kept as text.
+    """
+
+    # Never switch to raw <script>/<style> mode; a summary mentioning "<script>" would
+    # otherwise swallow the rest of the table.
+    CDATA_CONTENT_ELEMENTS = ()
+    _TABLE_TAGS = frozenset({"table", "colgroup", "col", "thead", "tbody", "tr", "td", "th"})
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.rows: List[List[str]] = []
+        self._row: Optional[List[str]] = None
+        self._cell: Optional[List[str]] = None
+
+    def _close_cell(self, *, implicit: bool = False) -> None:
+        if self._cell is not None and self._row is not None:
+            text = "".join(self._cell).strip()
+            # An unescaped "<" swallows the cell's own closing tag into its text.
+            if implicit and text[-5:].lower() in ("</td>", "</th>"):
+                text = text[:-5].rstrip()
+            self._row.append(text)
+        self._cell = None
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag not in self._TABLE_TAGS:
+            self.handle_data(self.get_starttag_text() or "")
+        elif tag == "tr":
+            self._row = []
+        elif tag in ("td", "th") and self._row is not None:
+            self._close_cell(implicit=True)
+            self._cell = []
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag not in self._TABLE_TAGS:
+            self.handle_data(self.get_starttag_text() or "")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag not in self._TABLE_TAGS:
+            self.handle_data(f"</{tag}>")
+        elif tag in ("td", "th"):
+            self._close_cell()
+        elif tag == "tr" and self._row is not None:
+            self._close_cell(implicit=True)
+            self.rows.append(self._row)
+            self._row = None
+
+    def handle_data(self, data: str) -> None:
+        if self._cell is not None:
+            self._cell.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        self.handle_data(f"<!--{data}-->")
+
+    def handle_decl(self, decl: str) -> None:
+        self.handle_data(f"<!{decl}>")
+
+    def unknown_decl(self, data: str) -> None:
+        self.handle_data(f"<![{data}]>")
+
+    def handle_pi(self, data: str) -> None:
+        self.handle_data(f"<?{data}>")
+
+
 def load_html_table(text: str) -> Tuple[List[str], List[Dict[str, str]]]:
     headers: List[str] = []
     rows: List[Dict[str, str]] = []
-    row_pat = re.compile(r"<tr>(.*?)</tr>", flags=re.DOTALL | re.IGNORECASE)
-    cell_pat = re.compile(r"<t[hd]>(.*?)</t[hd]>", flags=re.DOTALL | re.IGNORECASE)
-
-    def clean(cell: str) -> str:
-        cell_no_tags = re.sub(r"<.*?>", "", cell)
-        return unescape(cell_no_tags).strip()
-
-    for idx, row_html in enumerate(row_pat.findall(text)):
-        cells = [clean(c) for c in cell_pat.findall(row_html)]
+    parser = _HTMLTableParser()
+    parser.feed(text)
+    parser.close()
+    for idx, cells in enumerate(parser.rows):
         if not cells:
             continue
         if idx == 0:
@@ -664,7 +1240,8 @@ def load_html_table(text: str) -> Tuple[List[str], List[Dict[str, str]]]:
     return headers, rows
 
 
-def next_id(rows: Sequence[Dict[str, str]], prefix: str, *, pad: bool = True) -> str:
+def highest_id(rows: Iterable[Dict[str, str]], prefix: str) -> int:
+    """Return the largest numeric suffix among `prefix-N` IDs (0 when there are none)."""
     highest = 0
     for row in rows:
         ident = row.get("ID", "")
@@ -674,8 +1251,25 @@ def next_id(rows: Sequence[Dict[str, str]], prefix: str, *, pad: bool = True) ->
                 highest = max(highest, val)
             except ValueError:
                 continue
-    number = highest + 1
-    return f"{prefix}-{number:04d}" if pad else f"{prefix}-{number}"
+    return highest
+
+
+class IdAllocator:
+    """Hand out sequential `prefix-N` IDs following the highest one already in `rows`.
+
+    Scans the rows once up front so each `next()` is O(1) during a merge.
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, str]], prefix: str, *, pad: bool = True) -> None:
+        self.prefix = prefix
+        self.pad = pad
+        self.current = highest_id(rows, prefix)
+
+    def next(self) -> str:
+        self.current += 1
+        if self.pad:
+            return f"{self.prefix}-{self.current:04d}"
+        return f"{self.prefix}-{self.current}"
 
 
 def normalize_development_table(
@@ -717,9 +1311,10 @@ def normalize_development_table(
         )
 
     # Backfill IDs if missing (keeps any existing IDs unchanged).
+    ids = IdAllocator(normalized, prefix)
     for row in normalized:
         if not row.get("ID"):
-            row["ID"] = next_id(normalized, prefix, pad=True)
+            row["ID"] = ids.next()
 
     return target_headers, normalized
 
@@ -733,6 +1328,7 @@ def merge_development_items(
     """Merge grow/glow items into the simplified development tables."""
     if not rows:
         rows = []
+    ids = IdAllocator(rows, prefix)
     existing_index: Dict[Tuple[str, str], Dict[str, str]] = {}
     for row in rows:
         key = (
@@ -754,7 +1350,7 @@ def merge_development_items(
             row[desc_field] = summary
         else:
             new_row = {
-                "ID": next_id(rows, prefix, pad=True),
+                "ID": ids.next(),
                 "Person": item.owner,
                 desc_field: summary,
             }
@@ -765,48 +1361,38 @@ def merge_development_items(
 
 
 
+def iter_html_table(
+    headers: Sequence[str],
+    rows: Iterable[Dict[str, str]],
+    col_widths: Sequence[int],
+) -> Iterable[str]:
+    """Yield the lines of an HTML table with explicit column widths, one row at a time."""
+    yield "<table>"
+    yield "<colgroup>"
+    for width in col_widths:
+        yield f'<col style="width:{width}%">'
+    yield "</colgroup>"
+    yield "<thead>"
+    yield "<tr>" + "".join(f"<th>{escape(h, quote=False)}</th>" for h in headers) + "</tr>"
+    yield "</thead>"
+    yield "<tbody>"
+    for row in rows:
+        yield "<tr>" + "".join(f"<td>{escape(row.get(h, ''), quote=False)}</td>" for h in headers) + "</tr>"
+    yield "</tbody></table>"
+
+
 def render_html_table(
     headers: Sequence[str],
     rows: Sequence[Dict[str, str]],
     col_widths: Sequence[int],
 ) -> str:
     """Render an HTML table with explicit column widths."""
-    col_elems = [
-        f'<col style="width:{width}%">' for width in col_widths
-    ]
-    parts = [
-        "<table>",
-        "<colgroup>",
-        *col_elems,
-        "</colgroup>",
-        "<thead>",
-        "<tr>" + "".join(f"<th>{h}</th>" for h in headers) + "</tr>",
-        "</thead>",
-        "<tbody>",
-    ]
-    for row in rows:
-        parts.append("<tr>" + "".join(f"<td>{row.get(h, '')}</td>" for h in headers) + "</tr>")
-    parts.append("</tbody></table>")
-    return "\n".join(parts)
+    return "\n".join(iter_html_table(headers, rows, col_widths))
 
 
 def latex_escape(value: str) -> str:
-    replacements = {
-        "\\": r"\textbackslash{}",
-        "&": r"\&",
-        "%": r"\%",
-        "$": r"\$",
-        "#": r"\#",
-        "_": r"\_",
-        "{": r"\{",
-        "}": r"\}",
-        "~": r"\textasciitilde{}",
-        "^": r"\textasciicircum{}",
-    }
-    escaped = value
-    for src, repl in replacements.items():
-        escaped = escaped.replace(src, repl)
-    return escaped
+    # One pass, so the braces emitted for \textbackslash{} are not escaped again.
+    return _LATEX_SPECIALS_RE.sub(lambda match: LATEX_REPLACEMENTS[match.group(0)], value)
 
 
 def render_latex_table(
@@ -840,23 +1426,30 @@ def merge_items(
 ) -> List[Dict[str, str]]:
     if not headers:
         return rows
+    ids = IdAllocator(rows, prefix)
     existing_index: Dict[Tuple[str, ...], Dict[str, str]] = {}
     for row in rows:
         key = tuple(normalize_text(row.get(field, "")) for field in key_fields)
         existing_index[key] = row
 
+    # Items come in runs per meeting, so format each meeting's date only once.
+    date_labels: Dict[int, str] = {}
     for item in items:
+        meeting = item.meeting
+        date_label = date_labels.get(meeting.book_id)
+        if date_label is None:
+            date_label = date_labels[meeting.book_id] = meeting.meeting_date.strftime(DATE_FMT)
         candidate = {
             "ID": "",
-            "Date": item.meeting.meeting_date.strftime(DATE_FMT),
-            meeting_field: item.meeting.title,
+            "Date": date_label,
+            meeting_field: meeting.title,
             owner_field: item.owner,
             desc_field: item.summary,
             "Status": "open",
             "Incidents": "1",
         }
         if item.kind == "task":
-            candidate[meeting_field] = f"{item.meeting.title} ({item.meeting.tag})"
+            candidate[meeting_field] = f"{meeting.title} ({meeting.tag})"
             if item.due and "Due" in headers:
                 candidate["Due"] = item.due
         key = tuple(normalize_text(candidate.get(field, "")) for field in key_fields)
@@ -864,21 +1457,21 @@ def merge_items(
             row = existing_index[key]
             incidents = int(row.get("Incidents", "0") or "0")
             row["Incidents"] = str(incidents + 1)
-            row["Date"] = candidate["Date"]
-            row["Meeting"] = candidate["Meeting"]
+            row["Date"] = date_label
+            row[meeting_field] = candidate[meeting_field]
         else:
-            candidate["ID"] = next_id(rows + list(existing_index.values()), prefix)
+            candidate["ID"] = ids.next()
             rows.append(candidate)
             existing_index[key] = candidate
     return rows
 
 
 def write_log(path: Path, headers: Sequence[str], rows: Sequence[Dict[str, str]]) -> None:
-    lines = ["| " + " | ".join(headers) + " |", "|" + "|".join(["---"] * len(headers)) + "|"]
-    for row in rows:
-        line = "| " + " | ".join(row.get(h, "") for h in headers) + " |"
-        lines.append(line)
-    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write("| " + " | ".join(headers) + " |\n")
+        handle.write("|" + "|".join(["---"] * len(headers)) + "|\n")
+        for row in rows:
+            handle.write("| " + " | ".join([row.get(h, "") for h in headers]) + " |\n")
 
 
 def render_pdf_from_markdown(
@@ -892,13 +1485,13 @@ def render_pdf_from_markdown(
         return
     pdf_path = output_path or md_path.with_suffix(".pdf")
     input_path = md_path
-    temp_file: Optional[tempfile.NamedTemporaryFile] = None
+    temp_path: Optional[Path] = None
 
     if content is not None:
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".md")
-        temp_file.write(content.encode("utf-8"))
-        temp_file.flush()
-        input_path = Path(temp_file.name)
+        # Close the temp file before pandoc reads it; only the path is kept.
+        with tempfile.NamedTemporaryFile("wb", delete=False, suffix=".md") as temp_file:
+            temp_file.write(content.encode("utf-8"))
+        temp_path = input_path = Path(temp_file.name)
 
     cmd = ["pandoc", str(input_path), "-o", str(pdf_path), f"--pdf-engine={PANDOC_PDF_ENGINE}"]
     if extra_args:
@@ -912,25 +1505,28 @@ def render_pdf_from_markdown(
         stderr = exc.stderr.strip() if exc.stderr else str(exc)
         print(f"PDF generation failed for {pdf_path.name}: {stderr}")
     finally:
-        if temp_file:
-            try:
-                Path(temp_file.name).unlink()
-            except Exception:
-                pass
+        if temp_path is not None:
+            temp_path.unlink(missing_ok=True)
 
 
-def sort_by_person(rows: Sequence[Dict[str, str]], person_field: str = "Person", date_field: str = "Date") -> List[Dict[str, str]]:
-    def parse_date(value: str) -> dt.date:
-        try:
-            return dt.datetime.strptime(value, DATE_FMT).date()
-        except Exception:
-            return dt.date.min
+@functools.lru_cache(maxsize=4096)
+def log_date_ordinal(value: str) -> int:
+    """Ordinal of a log table date cell, or date.min's for unparseable cells.
 
+    Log rows share a handful of dates, so each distinct cell goes through strptime once.
+    """
+    try:
+        return as_date(value).toordinal()
+    except Exception:
+        return dt.date.min.toordinal()
+
+
+def sort_by_person(rows: Sequence[Dict[str, str]], person_field: str = "Person", date_field: str = "Date") -> List[Dict[str, str]]:
     return sorted(
         rows,
         key=lambda r: (
             normalize_text(r.get(person_field, "")),
-            -parse_date(r.get(date_field, "")).toordinal(),
+            -log_date_ordinal(r.get(date_field, "")),
             r.get("ID", ""),
         ),
     )
@@ -942,10 +1538,19 @@ def build_development_person_pages(
     glows_headers: Sequence[str],
     glows_rows: Sequence[Dict[str, str]],
 ) -> str:
-    # Gather unique people
-    people = sorted(
-        {normalize_text(row.get("Person", "")) for row in grows_rows + glows_rows if row.get("Person")}
-    )
+    # Bucket rows by normalized person in one pass; the first row seen supplies the label.
+    grows_by_person: Dict[str, List[Dict[str, str]]] = defaultdict(list)
+    glows_by_person: Dict[str, List[Dict[str, str]]] = defaultdict(list)
+    labels: Dict[str, str] = {}
+    named: Set[str] = set()
+    for rows, buckets in ((grows_rows, grows_by_person), (glows_rows, glows_by_person)):
+        for row in rows:
+            person_norm = normalize_text(row.get("Person", ""))
+            buckets[person_norm].append(row)
+            labels.setdefault(person_norm, row.get("Person"))
+            if row.get("Person"):
+                named.add(person_norm)
+    people = sorted(named)
     header = "# Development by Person\n"
     pages: List[str] = [header]
 
@@ -955,13 +1560,9 @@ def build_development_person_pages(
         return [render_latex_table(headers, rows, col_widths=(0.08, 0.18, 0.74))]
 
     for idx, person_norm in enumerate(people):
-        person_label = next(
-            (row.get("Person") for row in grows_rows + glows_rows if normalize_text(row.get("Person", "")) == person_norm),
-            person_norm,
-        )
-        pages.append(f"## {person_label}")
-        person_grows = [row for row in grows_rows if normalize_text(row.get("Person", "")) == person_norm]
-        person_glows = [row for row in glows_rows if normalize_text(row.get("Person", "")) == person_norm]
+        pages.append(f"## {labels[person_norm]}")
+        person_grows = grows_by_person.get(person_norm, [])
+        person_glows = glows_by_person.get(person_norm, [])
 
         pages.append("### Grows")
         pages.extend(build_table(grows_headers, person_grows))
@@ -987,11 +1588,7 @@ def load_development_tables(path: Path) -> Tuple[List[str], List[Dict[str, str]]
         nonlocal grows_headers, glows_headers, grows_rows, glows_rows
         if not section or not buf:
             return
-        text_block = "\n".join(buf)
-        if "<table" in text_block:
-            headers, rows = load_html_table(text_block)
-        else:
-            headers, rows = load_log_table_from_lines(buf)
+        headers, rows = load_log_table_from_lines(buf)
         if section == "Grows":
             grows_headers, grows_rows = headers, rows
         elif section == "Glows":
@@ -1016,15 +1613,16 @@ def write_development_tables(
     glows_headers: Sequence[str],
     glows_rows: Sequence[Dict[str, str]],
 ) -> None:
-    sections = []
-    sections.append("# Development\n")
-    sections.append("## Grows")
-    sections.append(render_html_table(grows_headers, grows_rows, col_widths=(10, 20, 70)))
-
-    sections.append("\n## Glows")
-    sections.append(render_html_table(glows_headers, glows_rows, col_widths=(10, 20, 70)))
-
-    path.write_text("\n".join(sections) + "\n", encoding="utf-8")
+    # Stream rows straight to disk instead of joining every rendered table in memory first.
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as handle:
+        handle.write("# Development\n\n## Grows\n")
+        handle.writelines(
+            f"{line}\n" for line in iter_html_table(grows_headers, grows_rows, col_widths=(10, 20, 70))
+        )
+        handle.write("\n## Glows\n")
+        handle.writelines(
+            f"{line}\n" for line in iter_html_table(glows_headers, glows_rows, col_widths=(10, 20, 70))
+        )
 
 
 def update_development_log(path: Path, meetings: List[Meeting], dry_run: bool) -> None:
@@ -1033,16 +1631,252 @@ def update_development_log(path: Path, meetings: List[Meeting], dry_run: bool) -
         headers = ["Run Date", "Meetings Processed", "Notes"]
         rows = []
     today = dt.datetime.now().strftime("%Y-%m-%d %H:%M")
-    meeting_titles = ", ".join(m.title for m in meetings) if meetings else "None"
+    meeting_titles = ", ".join(m.title for m in meetings[:DEVELOPMENT_LOG_MAX_TITLES]) or "None"
+    if len(meetings) > DEVELOPMENT_LOG_MAX_TITLES:
+        meeting_titles += f" ... (+{len(meetings) - DEVELOPMENT_LOG_MAX_TITLES} more)"
     note = f"Processed {len(meetings)} meeting(s)"
     rows.append({"Run Date": today, "Meetings Processed": meeting_titles, "Notes": note})
     if not dry_run:
         write_log(path, headers, rows)
 
 
+async def resolve_meeting_text(
+    meeting: Meeting,
+    text: Optional[str],
+    pdf_path: Optional[Path],
+    cache: Optional[sqlite3.Connection],
+    pdf_pool: Optional[Executor],
+    verbose: bool,
+) -> Tuple[Optional[str], str]:
+    """Return a meeting's transcript (falling back to its PDF) and where it came from."""
+    text_source = "fts"
+    if not text:
+        if pdf_path:
+            pdf_key = pdf_text_cache_key(pdf_path) if cache is not None else None
+            text = pdf_text_cache_get(cache, pdf_key) if pdf_key is not None else None
+            if not text:
+                loop = asyncio.get_running_loop()
+                text = await loop.run_in_executor(pdf_pool, extract_from_pdf, pdf_path)
+                # Failed or empty extractions (missing libraries, unreadable online-only
+                # files) are not cached, so the next run tries the PDF again.
+                if pdf_key is not None and text:
+                    pdf_text_cache_put(cache, pdf_key, text)
+            text_source = "pdf" if text else "pdf-empty"
+        else:
+            text_source = "none"
+    if not text:
+        if text_source == "pdf-empty" and pdf_path:
+            print(f"Skipping {meeting.title}: PDF found at {pdf_path} but no text extracted.")
+        elif text_source == "none":
+            print(f"Skipping {meeting.title}: no searchable text or PDF available.")
+        else:
+            print(f"Skipping {meeting.title}: no searchable text available.")
+        return None, text_source
+    if verbose:
+        print(
+            f"Meeting {meeting.title} ({meeting.meeting_date}, tag={meeting.tag}, "
+            f"source={text_source}, chars={len(text)})."
+        )
+    return text, text_source
+
+
+def report_meeting_items(
+    meeting: Meeting, items: Sequence[Item], text_source: str, text_len: int, args: argparse.Namespace
+) -> None:
+    if not items:
+        llm_note = (
+            f"llm={args.llm_model}" if args.llm == "openai" else f"llm={args.llm}"
+        )
+        print(
+            f"No development items found in {meeting.title} "
+            f"(date={meeting.meeting_date}, source={text_source}, chars={text_len}, {llm_note})."
+        )
+        return
+    if args.verbose:
+        kind_counts = Counter(item.kind for item in items)
+        counts_label = ", ".join(
+            f"{kind}={kind_counts[kind]}" for kind in ("grow", "glow") if kind_counts[kind]
+        )
+        if counts_label:
+            print(
+                f"Extracted {len(items)} development item(s) from {meeting.title} ({counts_label})."
+            )
+        else:
+            print(f"Extracted {len(items)} development item(s) from {meeting.title}.")
+
+
+async def extract_meeting_items(
+    meeting: Meeting,
+    text: str,
+    text_source: str,
+    args: argparse.Namespace,
+    client: Any,
+    semaphore: asyncio.Semaphore,
+    debug_dir: Optional[Path],
+    cache: Optional[sqlite3.Connection],
+    rate_limiter: Optional[LLMRateLimiter],
+) -> Dict[int, List[Item]]:
+    """Run LLM extraction on one meeting's transcript."""
+    try:
+        async with semaphore:
+            items = await llm_extract_items_openai(
+                client,
+                text,
+                meeting,
+                args.llm_model,
+                args.llm_max_chars,
+                args.llm_max_output_tokens,
+                debug_dir,
+                args.llm_debug_title,
+                cache=cache,
+                rate_limiter=rate_limiter,
+                verbose=args.verbose,
+            )
+    except Exception as exc:
+        print(
+            f"LLM extraction failed for {meeting.title} "
+            f"(source={text_source}, chars={len(text)}): {exc}"
+        )
+        items = []
+    return {meeting.book_id: items}
+
+
+async def extract_batch_items(
+    batch: Sequence[Tuple[Meeting, str]],
+    args: argparse.Namespace,
+    client: Any,
+    semaphore: asyncio.Semaphore,
+    debug_dir: Optional[Path],
+    cache: Optional[sqlite3.Connection],
+    rate_limiter: Optional[LLMRateLimiter],
+) -> Dict[int, List[Item]]:
+    """Run LLM extraction on several already-trimmed transcripts in one request."""
+    try:
+        async with semaphore:
+            return await llm_extract_items_openai_batch(
+                client,
+                batch,
+                args.llm_model,
+                args.llm_max_output_tokens,
+                debug_dir,
+                args.llm_debug_title,
+                cache=cache,
+                rate_limiter=rate_limiter,
+                verbose=args.verbose,
+            )
+    except Exception as exc:
+        titles = ", ".join(meeting.title for meeting, _ in batch)
+        print(f"LLM extraction failed for batch ({titles}): {exc}")
+        return {}
+
+
+async def extract_all_items(
+    meetings: Sequence[Meeting],
+    texts_by_id: Dict[int, str],
+    pdf_paths_by_id: Dict[int, Path],
+    args: argparse.Namespace,
+    debug_dir: Optional[Path],
+) -> List[Item]:
+    """Extract items for all meetings concurrently, bounded by --llm-concurrency."""
+    client = None
+    cache: Optional[sqlite3.Connection] = None
+    if args.llm == "openai":
+        try:
+            client = create_openai_client()
+        except RuntimeError as exc:
+            print(f"LLM extraction unavailable: {exc}")
+            return []
+    semaphore = asyncio.Semaphore(max(1, args.llm_concurrency))
+    rate_limiter = None
+    if args.llm_max_rpm > 0 or args.llm_max_tpm > 0:
+        rate_limiter = LLMRateLimiter(args.llm_max_rpm, args.llm_max_tpm)
+    # PDF parsing is CPU-bound Python, so fan it out across processes rather than threads.
+    # Workers are spawned, not forked: the pool starts them on demand while the OpenAI
+    # client's threads may be mid-subprocess, and a forked worker can inherit that
+    # child's exec pipe and stall the request forever.
+    pdf_pool = None
+    if pdf_paths_by_id:
+        pdf_pool = ProcessPoolExecutor(
+            max_workers=min(len(pdf_paths_by_id), os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    items_by_id: Dict[int, List[Item]] = {}
+    batching = args.llm == "openai" and args.llm_batch_size > 1
+
+    def get_cache() -> Optional[sqlite3.Connection]:
+        # Opened on first use, so runs that never parse a PDF or call the API (and
+        # dry runs, which leave log-dir untouched) do not create llm_cache.sqlite.
+        nonlocal cache
+        if cache is None and args.llm_cache and not args.dry_run:
+            cache = open_llm_cache(args.log_dir / "llm_cache.sqlite")
+        return cache
+
+    async def prepare_meeting(meeting: Meeting) -> Optional[Tuple[Meeting, str, str]]:
+        text = texts_by_id.get(meeting.book_id)
+        pdf_path = pdf_paths_by_id.get(meeting.book_id)
+        text, text_source = await resolve_meeting_text(
+            meeting,
+            text,
+            pdf_path,
+            get_cache() if not text and pdf_path else None,
+            pdf_pool,
+            args.verbose,
+        )
+        if not text:
+            return None
+        if args.llm != "openai":
+            if args.verbose:
+                print(f"LLM extraction disabled (llm={args.llm}); skipping {meeting.title}.")
+            return meeting, text, text_source
+        # Too little text to hold a grow/glow; not worth a billable call.
+        if len(text) < args.llm_min_chars:
+            print(f"Skipping {meeting.title}: text too short ({len(text)} chars).")
+            return None
+        if not batching:
+            # Start this meeting's request as soon as its own text is ready, so PDF
+            # parsing for other meetings overlaps with calls already in flight.
+            items_by_id.update(
+                await extract_meeting_items(
+                    meeting, text, text_source, args, client, semaphore, debug_dir, get_cache(), rate_limiter
+                )
+            )
+        return meeting, text, text_source
+
+    try:
+        prepared = await asyncio.gather(*(prepare_meeting(meeting) for meeting in meetings))
+        ready = [entry for entry in prepared if entry is not None]
+        if batching:
+            trimmed = [
+                (meeting, select_transcript(text, meeting, args.llm_max_chars, args.verbose)[0])
+                for meeting, text, _ in ready
+            ]
+            batches = pack_meeting_batches(trimmed, args.llm_batch_size, args.llm_max_chars)
+            if args.verbose:
+                print(f"Packed {len(trimmed)} meeting(s) into {len(batches)} LLM request(s).")
+            results = await asyncio.gather(
+                *(
+                    extract_batch_items(batch, args, client, semaphore, debug_dir, get_cache(), rate_limiter)
+                    for batch in batches
+                )
+            )
+            for result in results:
+                items_by_id.update(result)
+    finally:
+        if pdf_pool is not None:
+            pdf_pool.shutdown()
+        if client is not None:
+            await client.close()
+        if cache is not None:
+            cache.close()
+    development_items: List[Item] = []
+    for meeting, text, text_source in ready:
+        items = items_by_id.get(meeting.book_id, [])
+        report_meeting_items(meeting, items, text_source, len(text), args)
+        development_items.extend(items)
+    return development_items
+
+
 def process(args: argparse.Namespace) -> None:
-    if load_dotenv:
-        load_dotenv(Path(__file__).resolve().parent.parent / ".env")
     calibre_root = args.calibre_root
     metadata_db = calibre_root / "metadata.db"
     fts_db = calibre_root / "full-text-search.db"
@@ -1064,7 +1898,7 @@ def process(args: argparse.Namespace) -> None:
     )
     print(
         f"LLM mode: {args.llm} (model={args.llm_model}, max_chars={args.llm_max_chars}, "
-        f"max_output_tokens={args.llm_max_output_tokens}), "
+        f"max_output_tokens={args.llm_max_output_tokens}, concurrency={args.llm_concurrency}), "
         f"dry_run={args.dry_run}."
     )
     if args.llm_debug:
@@ -1073,89 +1907,31 @@ def process(args: argparse.Namespace) -> None:
         print(f"Calibre root: {calibre_root}")
         print(f"Log dir: {log_dir}")
 
-    meetings = load_meetings(
-        metadata_db,
-        calibre_root,
-        start_date,
-        end_date,
-        tag_prefixes=tag_prefixes,
-        author_filter=args.author,
-    )
-    if not meetings:
-        print(f"No meetings tagged with prefixes ({prefix_label}) between {start_date} and {end_date}.")
-        return
-    print(f"Found {len(meetings)} meeting(s) matching filters.")
-
-    development_items: List[Item] = []
-    for meeting in meetings:
-        text_source = "fts"
-        pdf_path: Optional[Path] = None
-        text = load_searchable_text(fts_db, meeting.book_id)
-        if not text:
-            pdf_path = fetch_pdf_path(metadata_db, calibre_root, meeting)
-            if pdf_path:
-                text = extract_from_pdf(pdf_path)
-                text_source = "pdf" if text else "pdf-empty"
-            else:
-                text_source = "none"
-        if not text:
-            if text_source == "pdf-empty" and pdf_path:
-                print(f"Skipping {meeting.title}: PDF found at {pdf_path} but no text extracted.")
-            elif text_source == "none":
-                print(f"Skipping {meeting.title}: no searchable text or PDF available.")
-            else:
-                print(f"Skipping {meeting.title}: no searchable text available.")
-            continue
-        text_len = len(text)
-        if args.verbose:
-            print(
-                f"Meeting {meeting.title} ({meeting.meeting_date}, tag={meeting.tag}, "
-                f"source={text_source}, chars={text_len})."
-            )
-        items: List[Item] = []
-        if args.llm == "openai":
-            try:
-                items = llm_extract_items_openai(
-                    text,
-                    meeting,
-                    args.llm_model,
-                    args.llm_max_chars,
-                    args.llm_max_output_tokens,
-                    debug_dir,
-                    args.llm_debug_title,
-                    verbose=args.verbose,
-                )
-            except Exception as exc:
-                print(
-                    f"LLM extraction failed for {meeting.title} "
-                    f"(source={text_source}, chars={text_len}): {exc}"
-                )
-                items = []
-        elif args.verbose:
-            print(f"LLM extraction disabled (llm={args.llm}); skipping {meeting.title}.")
-        if not items:
-            llm_note = (
-                f"llm={args.llm_model}" if args.llm == "openai" else f"llm={args.llm}"
-            )
+    with contextlib.closing(connect_readonly(metadata_db)) as metadata_conn:
+        meetings = load_meetings(
+            metadata_conn,
+            calibre_root,
+            start_date,
+            end_date,
+            tag_prefixes=tag_prefixes,
+            author_filter=args.author,
+        )
+        if not meetings:
             print(
-                f"No development items found in {meeting.title} "
-                f"(date={meeting.meeting_date}, source={text_source}, chars={text_len}, {llm_note})."
-            )
-            continue
-        if args.verbose:
-            kind_counts = {kind: 0 for kind in ("grow", "glow")}
-            for item in items:
-                kind_counts[item.kind] += 1
-            counts_label = ", ".join(
-                f"{kind}={count}" for kind, count in kind_counts.items() if count
+                f"No meetings tagged with prefixes ({prefix_label}) between {start_date} and {end_date}."
             )
-            if counts_label:
-                print(
-                    f"Extracted {len(items)} development item(s) from {meeting.title} ({counts_label})."
-                )
-            else:
-                print(f"Extracted {len(items)} development item(s) from {meeting.title}.")
-        development_items.extend(items)
+            return
+        print(f"Found {len(meetings)} meeting(s) matching filters.")
+
+        with contextlib.closing(connect_readonly(fts_db)) as fts_conn:
+            texts_by_id = load_searchable_texts(fts_conn, [m.book_id for m in meetings])
+        pdf_paths_by_id = fetch_pdf_paths(
+            metadata_conn, [m for m in meetings if m.book_id not in texts_by_id]
+        )
+
+    development_items = asyncio.run(
+        extract_all_items(meetings, texts_by_id, pdf_paths_by_id, args, debug_dir)
+    )
 
     if not development_items:
         print("No development items identified.")
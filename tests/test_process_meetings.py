@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import datetime as dt
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import process_meetings as pm  # noqa: E402
+
+
+def make_library(tags: Sequence[str]) -> sqlite3.Connection:
+    """Build an in-memory Calibre metadata.db with one meeting book per tag."""
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(
+        """
+        CREATE TABLE books (id INTEGER PRIMARY KEY, title TEXT, path TEXT);
+        CREATE TABLE tags (id INTEGER PRIMARY KEY, name TEXT);
+        CREATE TABLE books_tags_link (book INTEGER, tag INTEGER);
+        CREATE TABLE authors (id INTEGER PRIMARY KEY, name TEXT);
+        CREATE TABLE books_authors_link (book INTEGER, author INTEGER);
+        """
+    )
+    for book_id, tag in enumerate(tags, start=1):
+        conn.execute("INSERT INTO books VALUES (?, ?, ?)", (book_id, f"Meeting {book_id}", f"b{book_id}"))
+        conn.execute("INSERT INTO tags VALUES (?, ?)", (book_id, tag))
+        conn.execute("INSERT INTO books_tags_link VALUES (?, ?)", (book_id, book_id))
+    return conn
+
+
+def test_load_meetings_unpadded_tag_dates_kept_in_range() -> None:
+    conn = make_library(
+        [
+            "Meetings.2024-01-10",
+            "Meetings.2024-1-06",
+            "Meetings.2024-2-01",
+            "Meetings.2023-12-31",
+            "Meetings.not-a-date",
+        ]
+    )
+    meetings = pm.load_meetings(
+        conn, Path("/library"), dt.date(2024, 1, 1), dt.date(2024, 1, 31), ["Meetings"], None
+    )
+    assert sorted(m.meeting_date for m in meetings) == [dt.date(2024, 1, 6), dt.date(2024, 1, 10)]
+
+
+def test_html_table_round_trip_keeps_angle_brackets() -> None:
+    headers = ["ID", "Summary", "Owner"]
+    rows = [
+        {"ID": "D-0001", "Summary": "Ship v2<v3 first", "Owner": "Bob O'Neil"},
+        {"ID": "D-0002", "Summary": "Said x<y is fine", "Owner": "A & B"},
+        {"ID": "D-0003", "Summary": "x <!-- y", "Owner": "Alice"},
+        {"ID": "D-0004", "Summary": "<script>alert(1)", "Owner": "Alice"},
+    ]
+    html = pm.render_html_table(headers, rows, [10, 70, 20])
+    assert pm.load_html_table(html) == (headers, rows)
+
+
+def test_parse_llm_items_non_string_type_skipped() -> None:
+    meeting = pm.Meeting(
+        book_id=1,
+        title="Meeting 1",
+        path=Path("/library/b1"),
+        meeting_date=dt.date(2024, 1, 6),
+        tag="Meetings.2024-01-06",
+    )
+    data = [
+        {"type": ["glow"], "summary": "Listed type", "owner": "Alice"},
+        {"type": None, "summary": "Null type", "owner": "Alice"},
+        {"type": " Glow ", "summary": "Asked great questions", "owner": "Alice"},
+    ]
+    items = pm.parse_llm_items(data, meeting)
+    assert [(item.kind, item.summary) for item in items] == [("glow", "Asked great questions")]